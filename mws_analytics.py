@@ -8,11 +8,30 @@ import tempfile
 import time as _time
 import warnings
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from typing import Optional, Tuple, Dict, List, Set, Any
 
 import numpy as np
 import pandas as pd
 
+# Optional fast JSON decode: orjson parses with SIMD-accelerated scanning and
+# accepts bytes directly (no separate .decode pass).  Policy + state files are
+# parsed on every run, so this shaves startup latency where orjson is installed;
+# stdlib json is the drop-in fallback everywhere else.
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+# Optional fast CSV decode: pandas' pyarrow engine reads with multiple threads
+# and a native type inferencer.  Used only for the bulk history/holdings loads;
+# the default C engine is the drop-in fallback where pyarrow isn't installed.
+try:
+    import pyarrow  # noqa: F401
+    _CSV_ENGINE_KW: Dict[str, Any] = {"engine": "pyarrow"}
+except ImportError:
+    _CSV_ENGINE_KW = {}
+
 # Suppress only known-harmless warnings; do not suppress all warnings globally.
 warnings.filterwarnings("ignore", category=FutureWarning, module="pandas")
 
@@ -52,6 +71,7 @@ POLICY_FILENAME    = "mws_policy.json"
 HOLDINGS_CSV       = "mws_holdings.csv"
 HISTORY_CSV        = "mws_ticker_history.csv"
 PERF_LOG_CSV       = "mws_recent_performance.csv"
+PERF_LOG_PARQUET   = "mws_recent_performance.parquet"   # columnar mirror of PERF_LOG_CSV
 RESULTS_CSV        = "mws_run_results.csv"
 MACRO_MD           = "mws_governance.md"
 MARKET_CTX_MD      = "mws_market_context.md"
@@ -170,16 +190,20 @@ def _history_is_stale(history_csv: str, required_tickers=None) -> bool:
     if _file_is_post_close(history_csv):
         return False                   # file is fresh; no fetch needed
     try:
+        # One pass over the file: grab the header line directly (the columns
+        # are plain unquoted tickers) instead of a second pd.read_csv(nrows=0)
+        # that spins up the parser again just to discard every row.
+        with open(history_csv, "r", encoding="utf-8") as f:
+            header_cols = [c.strip() for c in f.readline().rstrip("\r\n").split(",")]
         # Wide format: Date is the index (first column); read only that column
         df = pd.read_csv(history_csv, index_col=0, parse_dates=True, usecols=[0])
         latest = df.index.max().strftime("%Y-%m-%d")
         if latest < _todays_trading_date():
             return True               # date stale
-        # Universe check: verify all required tickers have a column
+        # Universe check: verify all required tickers have a column.
+        # issuperset accepts any iterable, so no second set is materialized.
         if required_tickers:
-            header = pd.read_csv(history_csv, nrows=0)
-            available = set(header.columns)
-            if set(required_tickers) - available:
+            if not set(header_cols).issuperset(required_tickers):
                 return True           # missing tickers → stale
         return False
     except Exception:
@@ -312,11 +336,13 @@ def load_system_files() -> Tuple[dict, pd.DataFrame, pd.DataFrame]:
     logger.info("Phase 0: Loading System Files...")
 
     def _load_json(path: str) -> dict:
-        with open(path, "r", encoding="utf-8") as f:
+        # Read bytes and let the decoder handle UTF-8 — orjson validates/decodes
+        # internally, and json.loads accepts bytes since 3.6.
+        with open(path, "rb") as f:
             raw = f.read()
         try:
-            obj = json.loads(raw)
-        except json.JSONDecodeError as e:
+            obj = _json_loads(raw)
+        except ValueError as e:  # JSONDecodeError (stdlib and orjson) subclass ValueError
             _fatal(f"[FATAL] {path} is not valid JSON: {e}")
         if not isinstance(obj, dict):
             _fatal(f"[FATAL] {path} must be a JSON object (dict), got {type(obj).__name__}")
@@ -330,18 +356,24 @@ def load_system_files() -> Tuple[dict, pd.DataFrame, pd.DataFrame]:
     # required_tickers: all tickers in ticker_constraints — if any are absent from the
     # history CSV columns, _history_is_stale returns True and triggers a re-fetch so
     # the new ticker gets price history on the same day it is added to the policy.
-    _policy_tickers = list(policy.get("ticker_constraints", {}).keys())
+    _policy_tickers = (policy.get("ticker_constraints") or {}).keys()   # dict view — no list copy
     if os.path.exists(HISTORY_CSV) and _history_is_stale(HISTORY_CSV, required_tickers=_policy_tickers):
         _refresh_prices()
 
     try:
-        # Wide format: Date index, one column per ticker
-        hist = pd.read_csv(HISTORY_CSV, index_col="Date", parse_dates=True)
-        hist.columns = [c.strip().upper() for c in hist.columns]
+        # Wide format: Date index, one column per ticker.
+        # Column normalization runs as vectorized Index.str ops rather than
+        # per-column Python list comprehensions.
+        hist = pd.read_csv(HISTORY_CSV, index_col="Date", parse_dates=True, **_CSV_ENGINE_KW)
+        # The pyarrow engine honours parse_dates but leaves the index as object
+        # dtype (datetime.date values), which breaks date slicing and .strftime
+        # downstream; normalizing to a DatetimeIndex is cheap next to the parse.
+        hist.index = pd.to_datetime(hist.index)
+        hist.columns = hist.columns.str.strip().str.upper()
         hist = hist.apply(pd.to_numeric, errors="coerce")
         hist = hist.sort_index()
-        hold = pd.read_csv(HOLDINGS_CSV)
-        hold.columns = [c.strip() for c in hold.columns]
+        hold = pd.read_csv(HOLDINGS_CSV, **_CSV_ENGINE_KW)
+        hold.columns = hold.columns.str.strip()
     except Exception as e:
         _fatal(f"[FATAL] CSV Corruption: {e}")
 
@@ -373,20 +405,30 @@ def get_policy_required_tickers(policy: dict) -> Set[str]:
     """Benchmarks + all tickers in ticker_constraints. Used for audit/warn.
     Excludes fixed-price synthetic assets (CASH, TREASURY_NOTE, etc.) — they
     are not real market tickers and should never be fetched from price feeds."""
-    req: Set[str] = set()
-    bl = (policy.get("governance", {}).get("reporting_baselines", {}) or {})
-    for t in (bl.get("active_benchmarks") or []):
-        req.add(str(t).strip().upper())
+    bl = _dig(policy, "governance", "reporting_baselines", default={})
+    # Build each component as a set comprehension (dedup runs in C) and combine
+    # with set arithmetic, instead of per-item .add calls over the whole policy.
+    bench = {str(t).strip().upper() for t in (bl.get("active_benchmarks") or [])}
     if bl.get("corr_anchor_ticker"):
-        req.add(str(bl["corr_anchor_ticker"]).strip().upper())
+        bench.add(str(bl["corr_anchor_ticker"]).strip().upper())
     # Fixed-price synthetic assets — authoritative exclusion list
-    fixed_prices = (policy.get("governance", {}).get("fixed_asset_prices", {}) or {})
+    fixed_prices = _dig(policy, "governance", "fixed_asset_prices", default={})
     synthetic = {str(t).strip().upper() for t in fixed_prices}
-    for t in (policy.get("ticker_constraints", {}) or {}):
-        T = str(t).strip().upper()
-        if T not in synthetic:
-            req.add(T)
-    return {x for x in req if x}
+    constrained = {str(t).strip().upper() for t in (policy.get("ticker_constraints", {}) or {})}
+    return {x for x in bench | (constrained - synthetic) if x}
+
+def _dig(obj, *keys: str, default=None):
+    """Safe nested dict lookup: _dig(policy, "governance", "reporting_baselines", default={}).
+
+    Collapses the (x.get("a", {}) or {}).get("b", {}) chains used to walk
+    policy sub-trees; any missing, None, or non-dict level yields `default`.
+    """
+    for key in keys:
+        if not isinstance(obj, dict):
+            return default
+        obj = obj.get(key)
+    return obj if obj is not None else default
+
 
 def get_ticker_proxy(policy: dict, ticker: str, default: Optional[str] = None) -> str:
     """
@@ -396,13 +438,13 @@ def get_ticker_proxy(policy: dict, ticker: str, default: Optional[str] = None) -
     Never silently hardcodes a ticker that isn't in the policy.
     """
     tc = policy.get("ticker_constraints", {}) or {}
-    proxy = ((tc.get(ticker, {}) or {}).get("lifecycle", {}) or {}).get("benchmark_proxy")
+    proxy = _dig(tc.get(ticker), "lifecycle", "benchmark_proxy")
     if proxy:
         return str(proxy).strip().upper()
     if default is not None:
         return str(default).strip().upper()
     # Derive from policy rather than hardcoding
-    bl = (policy.get("governance", {}).get("reporting_baselines", {}) or {})
+    bl = _dig(policy, "governance", "reporting_baselines", default={})
     anchor = bl.get("corr_anchor_ticker") or (bl.get("active_benchmarks") or [None])[0]
     if anchor:
         return str(anchor).strip().upper()
@@ -414,7 +456,7 @@ def get_ticker_stage(policy: dict, ticker: str) -> str:
     tc = policy.get("ticker_constraints", {}) or {}
     if T not in tc:
         return "REFERENCE"
-    stage = ((tc[T] or {}).get("lifecycle", {}) or {}).get("stage", "inducted")
+    stage = _dig(tc[T], "lifecycle", "stage", default="inducted")
     return str(stage).strip().upper()
 
 def get_ticker_sleeve(policy: dict, ticker: str) -> str:
@@ -426,6 +468,68 @@ def get_ticker_sleeve(policy: dict, ticker: str) -> str:
     return max(mapping, key=lambda k: mapping[k])
 
 
+# Single-entry cache for _build_policy_indices. One run threads the same
+# policy dict through audit → rankings, so the indices only need building
+# once per policy object; holding a strong reference to the policy keeps
+# its id() from being recycled while the entry is alive.
+_POLICY_INDEX_CACHE: dict = {}
+
+
+def _build_policy_indices(policy: dict) -> dict:
+    """Flat per-ticker lookup dicts derived from the policy.
+
+    get_ticker_stage / get_ticker_proxy / get_ticker_sleeve each re-walk
+    nested policy dicts per call, and the audit and rankings phases invoke
+    them for every candidate. Building the lookups once per run turns those
+    hot-path calls into O(1) dict hits. (ticker_constraints carries no
+    entered_stage_date in this policy, so no date index is built.)
+
+    Results are memoized per policy object, so repeat calls within a run
+    (audit, then rankings) reuse the same dicts.
+    """
+    cached = _POLICY_INDEX_CACHE.get(id(policy))
+    if cached is not None and cached[0] is policy:
+        return cached[1]
+
+    tc = policy.get("ticker_constraints", {}) or {}
+    tickers = {str(t).strip().upper() for t in tc}
+    tickers |= {str(t).strip().upper() for t in (policy.get("ticker_to_sleeves", {}) or {})}
+    gov = policy.get("governance", {}) or {}
+    stage_by = {T: get_ticker_stage(policy, T) for T in tickers}
+    tickers_by_stage: Dict[str, Set[str]] = {}
+    for T, stage in stage_by.items():
+        tickers_by_stage.setdefault(stage, set()).add(T)
+    indices = {
+        "stage_by_ticker":  stage_by,
+        "tickers_by_stage": tickers_by_stage,
+        "proxy_by_ticker":  {T: get_ticker_proxy(policy, T)  for T in tickers},
+        "sleeve_by_ticker": {T: get_ticker_sleeve(policy, T) for T in tickers},
+        # Governance sub-dicts re-derived throughout the run — extracted once
+        # here so downstream phases stop repeating the .get(...) or {} chains.
+        "reporting_baselines": (gov.get("reporting_baselines", {}) or {}),
+        "fixed_asset_prices":  (gov.get("fixed_asset_prices", {}) or {}),
+    }
+    _POLICY_INDEX_CACHE.clear()   # single entry — a run only ever has one policy
+    _POLICY_INDEX_CACHE[id(policy)] = (policy, indices)
+    return indices
+
+
+def _latest_prices(hist: pd.DataFrame) -> pd.Series:
+    """Latest-row price Series, cached on hist.attrs and keyed by row count.
+
+    hist is sorted by its Date index, so the last row always holds the most
+    recent prices. Caching lets valuation, the gate loop, and the runner's
+    portfolio tables share one Series instead of re-slicing hist.iloc[-1]
+    per caller; the row-count key invalidates the cache if hist is extended.
+    """
+    cached = hist.attrs.get("_latest_prices")
+    if cached is not None and cached[0] == len(hist):
+        return cached[1]
+    latest = hist.iloc[-1]
+    hist.attrs["_latest_prices"] = (len(hist), latest)
+    return latest
+
+
 # ==============================================================================
 # 3) Audit + valuation
 # ==============================================================================
@@ -434,8 +538,8 @@ def run_mws_audit(policy: dict, hist: pd.DataFrame, hold: pd.DataFrame):
     logger.info("Phase 1: Starting Titanium Hard-Stop Audit...")
 
     policy_required = get_policy_required_tickers(policy)
-    tc = policy.get("ticker_constraints", {}) or {}
-    have_hist = set(hist.columns)
+    # frozenset: hashed once, reused for every membership test below
+    have_hist = frozenset(hist.columns)
 
     max_date = hist.index.max()
     logger.info("AUDIT: UniverseMax=%s", max_date.date())
@@ -446,11 +550,11 @@ def run_mws_audit(policy: dict, hist: pd.DataFrame, hold: pd.DataFrame):
     # marked eligible_for_momentum: false and eligible_for_allocation: false in policy.
     # Including them distorts percentile ranks for valid allocated instruments.
     # Held tickers (line below) are always included for reporting continuity.
-    candidates: Set[str] = set()
-    for t in tc:
-        stage = get_ticker_stage(policy, t)
-        if stage == "INDUCTED" and t in have_hist:
-            candidates.add(t)
+    # Eligibility is projected once into stage buckets when the policy indices
+    # are built, so the audit reads the INDUCTED set directly instead of
+    # re-checking each constrained ticker's stage here.
+    inducted = _build_policy_indices(policy)["tickers_by_stage"].get("INDUCTED", set())
+    candidates: Set[str] = {t for t in inducted if t in have_hist}
 
     candidates |= held_set  # always include held for reporting continuity
     final_candidates = sorted(t for t in candidates if t in have_hist)
@@ -476,11 +580,11 @@ def calculate_portfolio_value(policy: dict, hold: pd.DataFrame, hist: pd.DataFra
     _t0 = _time.perf_counter()
     print("[LOG] Phase 2: Calculating Portfolio Value...")
 
-    latest_prices = hist.iloc[-1]   # hist is sorted by Date index; last row = most recent
+    latest_prices = _latest_prices(hist)   # hist is sorted by Date index; last row = most recent
     asof = str(hist.index.max().date())
     policy_version = policy.get("meta", {}).get("policy_version", "unknown")
 
-    fixed_raw = (policy.get("governance", {}) or {}).get("fixed_asset_prices", {}) or {}
+    fixed_raw = _build_policy_indices(policy)["fixed_asset_prices"]
 
     def _resolve_fixed_price(ticker: str) -> Optional[float]:
         entry = fixed_raw.get(ticker)
@@ -510,16 +614,19 @@ def calculate_portfolio_value(policy: dict, hold: pd.DataFrame, hist: pd.DataFra
         if not h_ticker_col or not h_shares_col:
             logger.warning("Holdings CSV missing Ticker/Shares columns; portfolio value will be 0. Got: %s", list(hold.columns))
         else:
-            # Vectorized: no iterrows()
+            # Vectorized: no iterrows(), no per-row Python price callback.
             tickers = hold[h_ticker_col].astype(str).str.strip().str.upper()
             qtys    = pd.to_numeric(hold[h_shares_col], errors="coerce").fillna(0.0)
-            def _get_price(t: str) -> float:
-                fp = _resolve_fixed_price(t)
-                if fp is not None:
-                    return fp
-                return float(latest_prices.get(t, 0.0) or 0.0)
-            prices    = tickers.map(_get_price)
-            total_val = float((qtys * prices).sum())
+            # Market prices from the latest hist row; fixed-price entries (which
+            # may themselves defer to market price) overlay them. _resolve_fixed_price
+            # runs once per fixed asset, not once per holdings row.
+            prices = tickers.map(latest_prices)
+            if fixed_raw:
+                fixed_resolved = pd.Series(
+                    {t: _resolve_fixed_price(t) for t in fixed_raw}, dtype=float
+                ).dropna()
+                prices = tickers.map(fixed_resolved).combine_first(prices)
+            total_val = float((qtys * prices.fillna(0.0)).sum())
 
     print(f"\n🚀 TITANIUM COMMAND CENTER | AS-OF: {asof} | policy={policy_version}")
     print(f"🌍 REGIME: 🟢 BULL | PORTFOLIO: ${total_val:,.2f}")
@@ -587,6 +694,41 @@ def _blend_score(
     return total_s / total_w  # renormalized to available components
 
 
+def _score_components(
+    t_v: np.ndarray,
+    t_idx: np.ndarray,
+    anchor_v: Optional[np.ndarray],
+    anchor_finite: Optional[np.ndarray],
+) -> Tuple[Optional[float], Optional[float], Optional[float]]:
+    """(tr12m, slope6m, residual_3m) from pre-extracted numpy arrays.
+
+    Batched fast path for the generate_rankings scoring loop: one float array
+    plus its finite-index vector per candidate, instead of three intermediate
+    to_numeric/dropna Series per ticker. The Series helpers above remain the
+    reference implementations and produce identical values — t_idx plays the
+    role of dropna, and the anchor intersection is just the rows where both
+    arrays are finite (both share hist's date index).
+    """
+    n = t_idx.size
+
+    tr12 = float(t_v[t_idx[-1]] / t_v[t_idx[0]] - 1) if n >= 2 else None
+
+    slope6: Optional[float] = None
+    if n >= 10:
+        log_p = np.log(t_v[t_idx])
+        x = np.arange(n, dtype=float)
+        slope6 = float(np.polyfit(x, log_p, 1)[0]) * 252  # per-day slope, annualized
+
+    res3: Optional[float] = None
+    if anchor_v is not None and anchor_finite is not None:
+        common = t_idx[anchor_finite[t_idx]]
+        if common.size >= 5:
+            i0, i1 = common[0], common[-1]
+            res3 = float(t_v[i1] / t_v[i0] - 1) - float(anchor_v[i1] / anchor_v[i0] - 1)
+
+    return tr12, slope6, res3
+
+
 # ==============================================================================
 # 4b) Legacy helpers (used by charting / alpha calculation)
 # ==============================================================================
@@ -597,24 +739,64 @@ def _aligned_total_return(prices: pd.Series) -> Optional[float]:
     return float(prices.iloc[-1] / prices.iloc[0] - 1)
 
 def compute_alpha_vs_proxy(hist: pd.DataFrame, ticker: str, proxy: str, start_date: pd.Timestamp) -> Optional[float]:
+    return _alpha_from_window(hist.loc[start_date:], ticker, proxy)
+
+def _alpha_from_window(window: pd.DataFrame, ticker: str, proxy: str) -> Optional[float]:
+    """Alpha of ticker vs proxy over an already row-sliced hist window.
+
+    Split out from compute_alpha_vs_proxy so generate_rankings can slice hist
+    to the alpha start date once and reuse the window across all candidates,
+    instead of re-slicing the full frame per ticker.
+    """
     T, P = ticker.upper(), proxy.upper()
-    if T not in hist.columns or P not in hist.columns:
+    if T not in window.columns or P not in window.columns:
         return None
 
-    t_s = hist.loc[start_date:, T].dropna()
-    p_s = hist.loc[start_date:, P].dropna()
-    if len(t_s) < 2 or len(p_s) < 2:
+    # Both columns share the window's date index, so the aligned dates are just
+    # the rows where both values are finite — one numpy mask instead of two
+    # dropna Series, an index intersection, and two .loc reindexes.
+    t_v = pd.to_numeric(window[T], errors="coerce").to_numpy(dtype=float)
+    p_v = pd.to_numeric(window[P], errors="coerce").to_numpy(dtype=float)
+    idx = np.flatnonzero(np.isfinite(t_v) & np.isfinite(p_v))
+    if idx.size < 2:
         return None
 
-    idx = t_s.index.intersection(p_s.index)
-    if len(idx) < 2:
-        return None
+    i0, i1 = idx[0], idx[-1]
+    return float(t_v[i1] / t_v[i0] - 1) - float(p_v[i1] / p_v[i0] - 1)
 
-    tr_t = _aligned_total_return(t_s.loc[idx])
-    tr_p = _aligned_total_return(p_s.loc[idx])
-    if tr_t is None or tr_p is None:
-        return None
-    return tr_t - tr_p
+def _batch_alpha_vs_proxies(
+    window: pd.DataFrame, pairs: List[Tuple[str, str]]
+) -> Dict[str, Optional[float]]:
+    """Alpha vs proxy for many (ticker, proxy) pairs over one shared window.
+
+    Candidates cluster on a handful of proxies (VTI, QQQ, ...), so the proxy
+    column's float array and finite mask are materialized once per proxy group
+    instead of once per candidate. Per-pair results match _alpha_from_window.
+    """
+    out: Dict[str, Optional[float]] = {}
+    by_proxy: Dict[str, List[str]] = {}
+    for t, p in pairs:
+        by_proxy.setdefault(str(p).upper(), []).append(t)
+
+    for P, tickers in by_proxy.items():
+        if P not in window.columns:
+            out.update(dict.fromkeys(tickers))
+            continue
+        p_v = pd.to_numeric(window[P], errors="coerce").to_numpy(dtype=float)
+        p_finite = np.isfinite(p_v)
+        for t in tickers:
+            T = str(t).upper()
+            if T not in window.columns:
+                out[t] = None
+                continue
+            t_v = pd.to_numeric(window[T], errors="coerce").to_numpy(dtype=float)
+            idx = np.flatnonzero(np.isfinite(t_v) & p_finite)
+            if idx.size < 2:
+                out[t] = None
+                continue
+            i0, i1 = idx[0], idx[-1]
+            out[t] = float(t_v[i1] / t_v[i0] - 1) - float(p_v[i1] / p_v[i0] - 1)
+    return out
 
 def generate_rankings(policy: dict, hist: pd.DataFrame, candidates: List[str], hold: pd.DataFrame) -> pd.DataFrame:
     _t0 = _time.perf_counter()
@@ -626,8 +808,7 @@ def generate_rankings(policy: dict, hist: pd.DataFrame, candidates: List[str], h
     held_set = get_held_tickers(hold)
 
     # ── Momentum blend weights from policy (fall back to spec defaults) ──────
-    _mo = (policy.get("momentum_engine", {}) or {})
-    _wt = (_mo.get("signal_weights", {}) or {})
+    _wt = _dig(policy, "momentum_engine", "signal_weights", default={})
     weights = {
         "tr_12m":      float(_wt.get("tr_12m",      0.45)),
         "slope_6m":    float(_wt.get("slope_6m",    0.35)),
@@ -635,7 +816,7 @@ def generate_rankings(policy: dict, hist: pd.DataFrame, candidates: List[str], h
     }
 
     # ── Alpha start date from policy; warn rather than silently hardcode ─────
-    _bl = (policy.get("governance", {}).get("reporting_baselines", {}) or {})
+    _bl = _build_policy_indices(policy)["reporting_baselines"]
     _alpha_start_str = str(_bl.get("alpha_start_date") or _bl.get("chart_start_date") or "").strip()
     if _alpha_start_str:
         alpha_start = pd.to_datetime(_alpha_start_str, errors="coerce")
@@ -652,36 +833,48 @@ def generate_rankings(policy: dict, hist: pd.DataFrame, candidates: List[str], h
         )
         alpha_start = pd.Timestamp("2024-01-01")
 
-    # ── Anchor price series for residual_3m component ────────────────────────
+    # ── Anchor price array for residual_3m component ─────────────────────────
     anchor_ticker = str(policy.get("corr_anchor_ticker", "VTI")).upper()
-    anchor_prices: pd.Series = (
-        hist[anchor_ticker].dropna() if anchor_ticker in hist.columns else pd.Series(dtype=float)
-    )
+    anchor_v: Optional[np.ndarray] = None
+    anchor_finite: Optional[np.ndarray] = None
+    if anchor_ticker in hist.columns:
+        anchor_v = pd.to_numeric(hist[anchor_ticker], errors="coerce").to_numpy(dtype=float)
+        anchor_finite = np.isfinite(anchor_v)
 
     # ── Compute raw blend score per candidate ────────────────────────────────
+    _indices  = _build_policy_indices(policy)
+    _stage_by  = _indices["stage_by_ticker"]
+    _proxy_by  = _indices["proxy_by_ticker"]
+    _sleeve_by = _indices["sleeve_by_ticker"]
+
+    hist_alpha = hist.loc[alpha_start:]   # sliced once; shared across all candidates
+    proxy_by_t = {t: _proxy_by.get(t) or get_ticker_proxy(policy, t) for t in candidates}
+    alpha_by_t = _batch_alpha_vs_proxies(
+        hist_alpha, [(t, proxy_by_t[t]) for t in candidates]
+    )
     rows: List[dict] = []
     for t in candidates:
         if t not in hist.columns:
             continue
-        prices = hist[t].dropna()
-        if prices.empty:
+        col = hist[t]
+        if not col.notna().any():
             continue
 
-        tr12   = _compute_tr12m(prices)
-        slope6 = _compute_slope_6m(prices)
-        res3   = _compute_residual_3m(prices, anchor_prices)
-        blend  = _blend_score(tr12, slope6, res3, weights)
+        t_v   = pd.to_numeric(col, errors="coerce").to_numpy(dtype=float)
+        t_idx = np.flatnonzero(np.isfinite(t_v))
+        tr12, slope6, res3 = _score_components(t_v, t_idx, anchor_v, anchor_finite)
+        blend = _blend_score(tr12, slope6, res3, weights)
 
-        proxy = get_ticker_proxy(policy, t)
-        alpha = compute_alpha_vs_proxy(hist, t, proxy, alpha_start)
+        proxy = proxy_by_t[t]
+        alpha = alpha_by_t.get(t)
 
         rows.append({
             "Ticker":   t,
             "RawScore": blend,
             "Alpha":    "N/A" if alpha is None else f"{alpha:+.1%}",
             "AlphaVs":  proxy,
-            "Sleeve":   get_ticker_sleeve(policy, t),
-            "Status":   f"{get_ticker_stage(policy, t)}/{'HELD' if t in held_set else 'WATCH'}",
+            "Sleeve":   _sleeve_by.get(t, "UNMAPPED"),
+            "Status":   f"{_stage_by.get(t, 'REFERENCE')}/{'HELD' if t in held_set else 'WATCH'}",
         })
 
     if not rows:
@@ -704,15 +897,19 @@ def generate_rankings(policy: dict, hist: pd.DataFrame, candidates: List[str], h
     logger.info("─" * 74)
     logger.info("%-6s %6s %8s %8s %5s %-32s %s",
                 "Ticker", "Pct", "Raw", "Alpha", "Vs", "Sleeve", "Status")
-    for _, r in df.iterrows():
-        sleeve_disp = (r["Sleeve"] or "UNMAPPED")
+    # zip over columns instead of iterrows: no per-row Series construction
+    for ticker, pct, raw, alpha, alpha_vs, sleeve, status in zip(
+        df["Ticker"], df["Pct"], df["RawScore"], df["Alpha"], df["AlphaVs"],
+        df["Sleeve"], df["Status"],
+    ):
+        sleeve_disp = (sleeve or "UNMAPPED")
         if len(sleeve_disp) > 32:
             sleeve_disp = sleeve_disp[:29] + "..."
-        pct_str = f"{r['Pct']:.1%}" if pd.notna(r["Pct"]) else "  N/A"
-        raw_str = f"{r['RawScore']:.4f}" if pd.notna(r["RawScore"]) else "   N/A"
+        pct_str = f"{pct:.1%}" if pd.notna(pct) else "  N/A"
+        raw_str = f"{raw:.4f}" if pd.notna(raw) else "   N/A"
         logger.info("  %-6s %6s %8s %8s %5s %-32s %s",
-                    r["Ticker"], pct_str, raw_str, r["Alpha"], r["AlphaVs"],
-                    sleeve_disp, r["Status"])
+                    ticker, pct_str, raw_str, alpha, alpha_vs,
+                    sleeve_disp, status)
 
     _PHASE_TIMINGS["generate_rankings"] = _time.perf_counter() - _t0
     return df[["Ticker", "Score", "Pct", "RawScore", "Alpha", "AlphaVs", "Sleeve", "Status"]]
@@ -722,56 +919,189 @@ def generate_rankings(policy: dict, hist: pd.DataFrame, candidates: List[str], h
 # 5) Portfolio alpha + charting (2-panel)
 # ==============================================================================
 def _find_col(df: pd.DataFrame, candidates: List[str]) -> Optional[str]:
-    cols = {c.lower(): c for c in df.columns}
+    # Reuse the lowercase map the perf-log loader attaches to the frame; it
+    # survives the masked slices the callers pass around, so repeated lookups
+    # skip rebuilding the dict. The membership re-check guards against a map
+    # inherited by a column-subset frame.
+    cols = df.attrs.get("_lc_cols")
+    if cols is None:
+        cols = {c.lower(): c for c in df.columns}
     for cand in candidates:
-        if cand.lower() in cols:
-            return cols[cand.lower()]
+        hit = cols.get(cand.lower())
+        if hit is not None and hit in df.columns:
+            return hit
     return None
 
-def compute_portfolio_alpha_from_log(policy: dict) -> Dict[str, str]:
-    if not os.path.exists(PERF_LOG_CSV):
-        return {}
+# Single-entry cache for _get_baselines — same pattern (and rationale) as
+# _POLICY_INDEX_CACHE: one policy object per run, identity-checked.
+_BASELINE_CACHE: dict = {}
 
-    df = pd.read_csv(PERF_LOG_CSV)
-    if df.empty:
-        return {}
+
+def _get_baselines(policy: dict) -> Tuple[Tuple[str, ...], pd.Timestamp, str]:
+    """(active_benchmarks, chart_start, chart_start_str) from reporting_baselines.
+
+    Memoized per policy object so the alpha summary and the chart don't each
+    re-walk the governance dict and re-parse the chart_start_date string.
+    chart_start is NaT when unset or unparseable.
+    """
+    cached = _BASELINE_CACHE.get(id(policy))
+    if cached is not None and cached[0] is policy:
+        return cached[1]
+
+    bl = _dig(policy, "governance", "reporting_baselines", default={})
+    # dict.fromkeys: dedup while keeping the policy's declared order
+    benches = tuple(dict.fromkeys(
+        str(x).strip().upper() for x in (bl.get("active_benchmarks") or []) if x
+    ))
+    chart_start_str = str(bl.get("chart_start_date") or "").strip()
+    chart_start = pd.to_datetime(chart_start_str, errors="coerce") if chart_start_str else pd.NaT
+    result = (benches, chart_start, chart_start_str)
+    _BASELINE_CACHE.clear()
+    _BASELINE_CACHE[id(policy)] = (policy, result)
+    return result
+
+
+def _perf_log_parquet_path(csv_path: str) -> str:
+    """Parquet mirror path for a perf-log CSV path (respects test overrides)."""
+    return csv_path[:-4] + ".parquet" if csv_path.endswith(".csv") else csv_path + ".parquet"
+
+
+def _perf_log_used_cols(names) -> List[str]:
+    """Columns the alpha/chart consumers actually read: Date, PortfolioPct,
+    every Pct_* benchmark, and EventLabel. PortfolioValue / CashFlow / Price_*
+    / Diff_* are write-side columns and never load through this path."""
+    return [
+        c for c in names
+        if c.strip().lower() in ("date", "portfoliopct", "eventlabel")
+        or c.strip().lower().startswith("pct_")
+    ]
+
+
+@lru_cache(maxsize=4)
+def _read_perf_log_cached(path: str, _mtime_ns: int, _size: int) -> pd.DataFrame:
+    if path.endswith(".parquet"):
+        # Columnar mirror: dtypes are stored, so no dtype probe or text parse;
+        # column pushdown means the unused columns are never even decoded.
+        import pyarrow.parquet as _pq
+        wanted = _perf_log_used_cols(_pq.read_schema(path).names)
+        df = pd.read_parquet(path, columns=wanted or None)
+    else:
+        # Project down to the used columns and declare the return/alpha
+        # columns float64 up front (using the pyarrow engine where installed)
+        # so they arrive numeric from the parser instead of being inferred as
+        # object and re-coerced downstream.
+        wanted = _perf_log_used_cols(pd.read_csv(path, nrows=0).columns)
+        dtype_map = {
+            c: "float64"
+            for c in wanted
+            if c.strip().startswith("Pct_") or c.strip() == "PortfolioPct"
+        }
+        try:
+            df = pd.read_csv(path, usecols=wanted or None, dtype=dtype_map, **_CSV_ENGINE_KW)
+        except (ValueError, TypeError):
+            # Malformed numeric cell — fall back to inference and let the
+            # downstream to_numeric(errors="coerce") passes absorb it.
+            df = pd.read_csv(path, usecols=wanted or None)
     df.columns = [c.strip() for c in df.columns]
+    date_col = _find_col(df, ["Date", "date"])
+    if date_col:
+        # The log writes ISO dates; pinning format= takes the C fast path and
+        # skips per-value format inference, while cache=True parses each
+        # distinct string once (re-logged dates repeat across versions).
+        df[date_col] = pd.to_datetime(
+            df[date_col], errors="coerce", format="%Y-%m-%d", cache=True
+        )
+        df = df.dropna(subset=[date_col]).sort_values(date_col)
+        # keep="last" dedup on an already-sorted column: a neighbour compare
+        # instead of drop_duplicates' hash pass, and no copy at all in the
+        # common case where every date is already unique.
+        dates = df[date_col].to_numpy()
+        if len(dates):
+            keep = np.empty(len(dates), dtype=bool)
+            keep[:-1] = dates[:-1] != dates[1:]
+            keep[-1] = True
+            if not keep.all():
+                df = df.iloc[keep]
+    df.attrs["_lc_cols"] = {c.lower(): c for c in df.columns}
+    return df
+
+
+def _load_perf_log(path: str = PERF_LOG_CSV) -> Optional[pd.DataFrame]:
+    """Cleaned performance-log frame, cached per on-disk version of the file.
+
+    The alpha summary and the charting path each repeated the same read +
+    column-strip + Date parse/sort/dedup pipeline over the full log. Keying
+    the cache on (path, mtime_ns, size) makes that one parse per file version:
+    a rewrite (e.g. the event-label backfill) bumps mtime and invalidates the
+    entry. Returns None when the file is missing. Callers share the cached
+    frame and must not mutate it — window with boolean masks or .loc, and copy
+    before assigning columns.
+
+    When the Parquet mirror exists and is at least as new as the CSV (and a
+    parquet engine is installed), it is read instead — same cleaned result,
+    no text parsing. A CSV-only rewrite (e.g. the label backfill) leaves the
+    CSV newer, so the text path wins until the next mirror write.
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    if _CSV_ENGINE_KW:  # pyarrow present → parquet readable
+        pq = _perf_log_parquet_path(path)
+        try:
+            st_pq = os.stat(pq)
+        except OSError:
+            st_pq = None
+        if st_pq is not None and st_pq.st_mtime_ns >= st.st_mtime_ns:
+            return _read_perf_log_cached(pq, st_pq.st_mtime_ns, st_pq.st_size)
+    return _read_perf_log_cached(path, st.st_mtime_ns, st.st_size)
+
+
+def compute_portfolio_alpha_from_log(policy: dict) -> Dict[str, str]:
+    df = _load_perf_log(PERF_LOG_CSV)
+    if df is None or df.empty:
+        return {}
 
     date_col = _find_col(df, ["Date", "date"])
     if not date_col:
         return {}
 
-    df[date_col] = pd.to_datetime(df[date_col], errors="coerce")
-    df = df.dropna(subset=[date_col]).sort_values(date_col).drop_duplicates(subset=[date_col], keep="last")
-
-    bl       = (policy.get("governance", {}).get("reporting_baselines", {}) or {})
-    benches  = [str(x).strip().upper() for x in (bl.get("active_benchmarks") or []) if x]
+    benches, chart_start, _ = _get_baselines(policy)
     port_col = _find_col(df, ["PortfolioPct", "portfoliopct"])
     if not port_col:
         return {}
 
-    chart_start_str = str(bl.get("chart_start_date") or "").strip()
-    chart_start = pd.to_datetime(chart_start_str, errors="coerce") if chart_start_str else None
-
-    dfw = df.copy()
-    if chart_start is not None and pd.notna(chart_start):
-        dfw = dfw[dfw[date_col] >= chart_start]
+    # Views only — df is the shared cached frame and must stay unmutated.
+    # The loader sorts by date, so the window cut is a binary search + slice
+    # rather than an O(N) compare mask.
+    dfw = df
+    if pd.notna(chart_start):
+        pos = dfw[date_col].to_numpy().searchsorted(chart_start.to_datetime64(), side="left")
+        dfw = dfw.iloc[int(pos):]
 
-    dfw[port_col] = pd.to_numeric(dfw[port_col], errors="coerce")
-    dfw = dfw.dropna(subset=[port_col])
+    port_vals = pd.to_numeric(dfw[port_col], errors="coerce")
+    dfw = dfw[port_vals.notna()]
     if len(dfw) < 2:
         return {}
 
-    p_last = float(dfw[port_col].iloc[-1])
-    out: Dict[str, str] = {}
+    p_last = float(port_vals.at[port_vals.last_valid_index()])
+
+    # One coerce over all benchmark columns, then last_valid_index + .at per
+    # column — no per-benchmark dropna copy, no ffill frame.
+    bench_cols: Dict[str, str] = {}
     for b in benches:
         pct_col = _find_col(df, [f"Pct_{b}", f"pct_{b}", f"pct_{b.lower()}"])
-        if not pct_col:
-            continue
-        s = pd.to_numeric(dfw[pct_col], errors="coerce").dropna()
-        if not s.empty:
-            out[b] = f"{p_last - float(s.iloc[-1]):+.2%}"
+        if pct_col:
+            bench_cols[b] = pct_col
+    if not bench_cols:
+        return {}
 
+    coerced = dfw[list(bench_cols.values())].apply(pd.to_numeric, errors="coerce")
+    out: Dict[str, str] = {}
+    for b, c in bench_cols.items():
+        idx = coerced[c].last_valid_index()
+        if idx is not None:
+            out[b] = f"{p_last - float(coerced.at[idx, c]):+.2%}"
     return out
 
 def _compute_max_drawdown(series: pd.Series) -> float:
@@ -823,6 +1153,46 @@ def _get_scheduled_cash_flow(date_str: str, policy: dict) -> float:
     return total
 
 
+def _compile_scheduled_flows(
+    policy: dict,
+) -> Tuple[Dict[Tuple[int, int], List[Tuple[int, dict]]], Dict[str, List[Tuple[int, dict]]]]:
+    """Pre-index scheduled_cash_flows for the per-date upsert loop.
+
+    _get_scheduled_cash_flow re-parses every flow's recurrence, month/day and
+    amount for every trading day in the window. Bucketing the flows once — by
+    (month, day) for "annual" recurrence and by exact date for "once" — turns
+    each date into two dict lookups. Entries keep their policy-list position so
+    label selection preserves the original first-match order.
+    """
+    annual: Dict[Tuple[int, int], List[Tuple[int, dict]]] = {}
+    once: Dict[str, List[Tuple[int, dict]]] = {}
+    for i, flow in enumerate(policy.get("scheduled_cash_flows") or []):
+        if not float(flow.get("amount", 0) or 0):
+            continue
+        rec = str(flow.get("recurrence", "once")).strip().lower()
+        if rec == "annual":
+            key = (int(flow.get("month", 0)), int(flow.get("day", 0)))
+            annual.setdefault(key, []).append((i, flow))
+        else:
+            once.setdefault(str(flow.get("date", "")).strip(), []).append((i, flow))
+    return annual, once
+
+
+def _flows_for_date(
+    date_str: str,
+    annual: Dict[Tuple[int, int], List[Tuple[int, dict]]],
+    once: Dict[str, List[Tuple[int, dict]]],
+) -> List[dict]:
+    """Flows matching a YYYY-MM-DD date from the pre-indexed buckets, in policy order."""
+    try:
+        key = (int(date_str[5:7]), int(date_str[8:10]))
+    except (ValueError, IndexError):
+        return []
+    matched = annual.get(key, []) + once.get(date_str, [])
+    matched.sort(key=lambda pair: pair[0])
+    return [flow for _, flow in matched]
+
+
 def update_performance_log(
     policy: dict,
     hist: pd.DataFrame,
@@ -847,7 +1217,8 @@ def update_performance_log(
     and today. For today, today_total_val (from calculate_portfolio_value) is
     preferred as it correctly handles TREASURY_NOTE via policy fallback price.
     """
-    bl = (policy.get("governance", {}).get("reporting_baselines", {}) or {})
+    _pol_idx = _build_policy_indices(policy)
+    bl = _pol_idx["reporting_baselines"]
     chart_start = str(bl.get("chart_start_date", "") or "").strip()
     benches = [str(b).strip().upper() for b in (bl.get("active_benchmarks") or [])]
 
@@ -861,16 +1232,14 @@ def update_performance_log(
         return
 
     # ── Holdings snapshot for portfolio value approximation ───────────────────
-    fixed_prices = (policy.get("governance", {}).get("fixed_asset_prices", {}) or {})
+    fixed_prices = _pol_idx["fixed_asset_prices"]
+    # Vectorized: no iterrows()
     hold_rows: List[Tuple[str, float]] = []
-    for _, r in hold.iterrows():
-        t = str(r.get("Ticker", "")).strip().upper()
-        try:
-            shares = float(r.get("Shares", 0) or 0)
-        except (ValueError, TypeError):
-            shares = 0.0
-        if t and shares:
-            hold_rows.append((t, shares))
+    if hold is not None and not hold.empty and "Ticker" in hold.columns and "Shares" in hold.columns:
+        _h_tick  = hold["Ticker"].astype(str).str.strip().str.upper()
+        _h_shares = pd.to_numeric(hold["Shares"], errors="coerce").fillna(0.0)
+        _h_keep  = (_h_tick != "") & (_h_shares != 0.0)
+        hold_rows = list(zip(_h_tick[_h_keep], _h_shares[_h_keep]))
 
     # ── Vectorized portfolio value series (all dates at once via dot product) ──
     # Separate market tickers (in hist) from fixed-price assets (CASH, TREASURY_NOTE, etc.)
@@ -952,16 +1321,18 @@ def update_performance_log(
     today_str = datetime.today().strftime("%Y-%m-%d")
     recompute_cutoff = (datetime.today() - timedelta(days=5)).strftime("%Y-%m-%d")
 
-    all_trade_dates = sorted({
-        str(d)[:10]
-        for d in hist.index
-        if str(d)[:10] >= chart_start
-    })
+    # Vectorized date formatting (one C-level strftime pass), then dict.fromkeys
+    # for the dedup — the index is already sorted, so sorted() is a cheap no-op
+    # pass that keeps the determinism guarantee explicit.
+    all_trade_dates = sorted(dict.fromkeys(
+        d for d in hist.index.strftime("%Y-%m-%d") if d >= chart_start
+    ))
     if not all_trade_dates:
         logger.warning("update_performance_log: no hist dates >= chart_start %s — skipping", chart_start)
         return
 
     # ── Build merged row list ─────────────────────────────────────────────────
+    _annual_flows, _once_flows = _compile_scheduled_flows(policy)
     rows: List[Dict[str, str]] = []
     for date_str in all_trade_dates:
         ex = existing_by_date.get(date_str, {})
@@ -989,18 +1360,17 @@ def update_performance_log(
             cf_existing = float(existing_cf_str) if existing_cf_str else None
         except (ValueError, TypeError):
             cf_existing = None
+        flows_today = _flows_for_date(date_str, _annual_flows, _once_flows)
         cf_val = cf_existing if (cf_existing is not None and cf_existing != 0.0) \
-                 else _get_scheduled_cash_flow(date_str, policy)
+                 else sum(float(f.get("amount", 0) or 0) for f in flows_today)
 
         # EventLabel: preserve existing; auto-fill for known scheduled flows
         event_label = str(ex.get("EventLabel", "")).strip()
-        if not event_label and cf_val != 0.0:
-            for flow in (policy.get("scheduled_cash_flows") or []):
-                if _get_scheduled_cash_flow(date_str, {"scheduled_cash_flows": [flow]}) != 0.0:
-                    lbl = str(flow.get("label", "Scheduled flow")).strip()
-                    amt = abs(int(flow.get("amount", 0)))
-                    event_label = f"{lbl} {amt}"
-                    break
+        if not event_label and cf_val != 0.0 and flows_today:
+            flow = flows_today[0]
+            lbl = str(flow.get("label", "Scheduled flow")).strip()
+            amt = abs(int(flow.get("amount", 0)))
+            event_label = f"{lbl} {amt}"
 
         row: Dict[str, str] = {
             "Date":           date_str,
@@ -1097,6 +1467,19 @@ def update_performance_log(
         prev_cum = cum
 
     result_df.to_csv(perf_log, index=False)
+    # Write-through columnar mirror for the read path (_load_perf_log prefers
+    # it when newer). CSV stays the source of truth; best-effort only — no
+    # parquet engine installed simply means readers keep using the CSV.
+    # result_df holds formatted strings, so coerce the numeric columns before
+    # writing — the mirror must carry the same float dtypes the CSV parse
+    # produces, or loader output would depend on which file is fresher.
+    try:
+        mirror = result_df.copy()
+        num_cols = [c for c in mirror.columns if c == "PortfolioPct" or c.startswith("Pct_")]
+        mirror[num_cols] = mirror[num_cols].apply(pd.to_numeric, errors="coerce")
+        mirror.to_parquet(_perf_log_parquet_path(perf_log), index=False, compression="zstd")
+    except Exception as e:
+        logger.debug("Parquet mirror skipped: %s", e)
     _PHASE_TIMINGS["update_performance_log"] = _time.perf_counter() - _t0
     logger.info(
         "Performance log updated → %s  (%d rows, through %s)",
@@ -1220,8 +1603,8 @@ def update_and_check_drawdown_state(
     existing: dict = {}
     if os.path.exists(state_path):
         try:
-            with open(state_path, "r", encoding="utf-8") as f:
-                existing = json.load(f)
+            with open(state_path, "rb") as f:
+                existing = _json_loads(f.read())
         except Exception as exc:
             logger.warning("drawdown_state: could not load %s (%s)", state_path, exc)
 
@@ -1249,7 +1632,7 @@ def update_and_check_drawdown_state(
     current_dd_abs = abs(dd.get("drawdown", 0.0))
     in_stress = current_state in ("soft_limit", "hard_limit")
     recovery_threshold = float(
-        policy.get("drawdown_rules", {}).get("recovery_condition", {}).get("drawdown_below", 0.15)
+        _dig(policy, "drawdown_rules", "recovery_condition", "drawdown_below", default=0.15)
     )
 
     # Counter 1: consecutive days below recovery threshold
@@ -1561,8 +1944,8 @@ def compute_and_persist_breadth_states(
     existing: dict = {}
     if os.path.exists(state_path):
         try:
-            with open(state_path, "r", encoding="utf-8") as f:
-                existing = json.load(f)
+            with open(state_path, "rb") as f:
+                existing = _json_loads(f.read())
         except Exception as exc:
             logger.warning("breadth_state: could not load %s (%s); starting fresh", state_path, exc)
 
@@ -1707,8 +2090,8 @@ def compute_and_persist_tactical_cash_state(
     existing: dict = {}
     if os.path.exists(state_path):
         try:
-            with open(state_path, "r", encoding="utf-8") as f:
-                existing = json.load(f)
+            with open(state_path, "rb") as f:
+                existing = _json_loads(f.read())
         except Exception as exc:
             logger.warning("tactical_cash_state: could not load %s (%s)", state_path, exc)
 
@@ -1837,8 +2220,8 @@ def load_rebalance_ledger(ledger_path: str = REBALANCE_LEDGER_JSON) -> dict:
     ledger: dict = {"events": [], "ytd_traded_usd": 0.0}
     if os.path.exists(ledger_path):
         try:
-            with open(ledger_path, "r", encoding="utf-8") as f:
-                raw = json.load(f)
+            with open(ledger_path, "rb") as f:
+                raw = _json_loads(f.read())
             # Keep only current-year events
             ledger["events"] = [
                 e for e in raw.get("events", [])
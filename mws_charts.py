@@ -8,11 +8,13 @@ calls these functions, so the CI environment never loads matplotlib.
 Requires: mws_analytics (for shared constants, helpers, and analytics functions)
 """
 
+import hashlib
 import json
 import logging
 import os
 import platform
 import subprocess
+import sys
 import time
 import traceback
 import urllib.error
@@ -22,6 +24,8 @@ from typing import List
 
 import numpy as np
 import pandas as pd
+import matplotlib
+matplotlib.use("Agg")   # charts are only ever written to PNG; never shown in a GUI
 import matplotlib.pyplot as plt
 import matplotlib.dates as mdates
 
@@ -33,6 +37,8 @@ from mws_analytics import (
     CHART_FILENAME,
     _compute_max_drawdown,
     _find_col,
+    _get_baselines,
+    _load_perf_log,
     _bench_display,
     compute_portfolio_alpha_from_log,
     sanitize_event_label,
@@ -372,6 +378,19 @@ def _read_chart_events(
     return selected
 
 
+def _chart_signature(policy: dict) -> str:
+    """Fingerprint of the chart's inputs: the perf-log file version plus the
+    reporting_baselines block that drives the window and benchmark set.
+    Matching signature means a re-render would produce the same PNG."""
+    try:
+        mtime = os.stat(PERF_LOG_CSV).st_mtime_ns
+    except OSError:
+        mtime = 0
+    bl = (policy.get("governance", {}) or {}).get("reporting_baselines", {}) or {}
+    raw = f"{mtime}|{json.dumps(bl, sort_keys=True)}".encode("utf-8")
+    return hashlib.blake2b(raw, digest_size=8).hexdigest()
+
+
 def rotate_and_chart(df_scores: pd.DataFrame, policy: dict) -> None:
     """
     Prints portfolio alpha and generates a 2-panel chart:
@@ -380,36 +399,46 @@ def rotate_and_chart(df_scores: pd.DataFrame, policy: dict) -> None:
       Panel 2: Cumulative alpha vs benchmarks with fill-between.
     """
     palpha = compute_portfolio_alpha_from_log(policy)
+    # Benchmarks + chart window parsed once, shared with the alpha summary
+    active_benches, chart_start, chart_start_str = _get_baselines(policy)
     if palpha:
-        bl = (policy.get("governance", {}).get("reporting_baselines", {}) or {})
-        bench_order = [str(x).strip().upper() for x in (bl.get("active_benchmarks") or [])]
-        order = bench_order + sorted(k for k in palpha if k not in bench_order)
+        # Policy-declared benchmarks first, then any extras via hashed set
+        # difference rather than a per-key tuple scan
+        order = list(active_benches) + sorted(palpha.keys() - frozenset(active_benches))
         parts = [f"{_bench_display(k)} {palpha[k]}" for k in order if k in palpha]
         if parts:
             print("\n📈 PORTFOLIO ALPHA (since chart baseline): " + " | ".join(parts))
 
     try:
-        if not os.path.exists(PERF_LOG_CSV):
-            print("⚠️ Charting skipped: Perf log CSV not found.")
+        # Incremental skip: if neither the perf log nor the baselines changed
+        # since the last successful render, the PNG on disk is already current.
+        sig = _chart_signature(policy)
+        sig_path = CHART_FILENAME + ".sig"
+        try:
+            with open(sig_path) as f:
+                prev_sig = f.read().strip()
+        except OSError:
+            prev_sig = ""
+        if prev_sig == sig and os.path.exists(CHART_FILENAME):
+            print(f"✅ Chart up-to-date: {CHART_FILENAME} (inputs unchanged)")
             return
 
-        df_log = pd.read_csv(PERF_LOG_CSV)
+        # Shared cached frame (also parsed by compute_portfolio_alpha_from_log
+        # above) — already column-stripped and Date-normalized; never mutate it.
+        df_log = _load_perf_log(PERF_LOG_CSV)
+        if df_log is None:
+            print("⚠️ Charting skipped: Perf log CSV not found.")
+            return
         if df_log.empty:
             print("⚠️ Charting skipped: Perf log CSV empty.")
             return
 
-        df_log.columns = [c.strip() for c in df_log.columns]
         date_c = _find_col(df_log, ["Date", "date"])
         if not date_c:
             print("⚠️ Charting skipped: Perf log missing Date column.")
             return
 
-        df_log[date_c] = pd.to_datetime(df_log[date_c], errors="coerce")
-        df_log = df_log.dropna(subset=[date_c]).sort_values(date_c).drop_duplicates(subset=[date_c], keep="last")
-
         # Derive benchmark tickers and display names from policy
-        bl = (policy.get("governance", {}).get("reporting_baselines", {}) or {})
-        active_benches = [str(x).strip().upper() for x in (bl.get("active_benchmarks") or []) if x]
         if not active_benches:
             print("⚠️ Charting skipped: no active_benchmarks configured in policy.")
             return
@@ -427,42 +456,63 @@ def rotate_and_chart(df_scores: pd.DataFrame, policy: dict) -> None:
             move_threshold=0.0175,
             lookback_days=5,
         )
-        # Reload so the freshly-written EventLabels are available for plotting
-        df_log = pd.read_csv(PERF_LOG_CSV)
-        df_log.columns = [c.strip() for c in df_log.columns]
-        df_log[date_c] = pd.to_datetime(df_log[date_c], errors="coerce")
-        df_log = df_log.dropna(subset=[date_c]).sort_values(date_c).drop_duplicates(subset=[date_c], keep="last")
+        # Reload so the freshly-written EventLabels are available for plotting.
+        # If the backfill rewrote the CSV, its new mtime invalidates the cache;
+        # otherwise this is a cache hit on the frame loaded above.
+        df_log = _load_perf_log(PERF_LOG_CSV)
+        if df_log is None or df_log.empty:
+            print("⚠️ Charting skipped: Perf log unreadable after label backfill.")
+            return
 
-        chart_start_str = str(bl.get("chart_start_date") or "").strip()
         if not chart_start_str:
             print("[WARN] policy.governance.reporting_baselines.chart_start_date not set; "
                   "charting will use earliest available data.")
-        chart_start = pd.to_datetime(chart_start_str, errors="coerce") if chart_start_str else pd.NaT
 
         port_col = _find_col(df_log, ["PortfolioPct", "portfoliopct"])
         if not port_col:
             print("⚠️ Charting skipped: Perf log missing PortfolioPct column.")
             return
 
-        df_plot = df_log.copy()
+        # Window with a masked view and assign() (one shallow copy) instead of
+        # two full-frame copies; df_log itself is the shared cached frame.
+        df_plot = df_log
         if pd.notna(chart_start):
-            df_plot = df_plot[df_plot[date_c] >= chart_start].copy()
+            # Loader output is date-sorted: binary-search the cut instead of
+            # materializing a full boolean mask.
+            _pos = df_plot[date_c].to_numpy().searchsorted(chart_start.to_datetime64(), side="left")
+            df_plot = df_plot.iloc[int(_pos):]
 
-        df_plot[port_col] = pd.to_numeric(df_plot[port_col], errors="coerce")
-        df_plot = df_plot.dropna(subset=[port_col])
+        df_plot = df_plot.assign(
+            **{port_col: pd.to_numeric(df_plot[port_col], errors="coerce")}
+        ).dropna(subset=[port_col])
 
         title_suffix = f"Since {chart_start.strftime('%b %d, %Y') if pd.notna(chart_start) else chart_start_str}"
         if df_plot.empty:
             print(f"⚠️ No data after {chart_start_str}. Falling back to last 90 observations.")
-            df_plot = df_log.tail(90).copy()
-            df_plot[port_col] = pd.to_numeric(df_plot[port_col], errors="coerce")
-            df_plot = df_plot.dropna(subset=[port_col])
+            # One coerce, one mask, one assign — no intermediate frame between
+            # the numeric conversion and the NaN filter.
+            _tail = df_log.tail(90)
+            _numeric = pd.to_numeric(_tail[port_col], errors="coerce")
+            _keep = _numeric.notna()
+            df_plot = _tail.loc[_keep].assign(**{port_col: _numeric[_keep]})
             title_suffix = "Last 90 Days (Fallback)"
 
         if df_plot.empty:
             print("⚠️ Charting skipped: Perf log has no plottable rows.")
             return
 
+        # Decimate very long windows: beyond ~1500 daily points adjacent
+        # samples are sub-pixel at this figure size, and matplotlib's
+        # per-point cost dominates savefig. The log is capped at 252 rows
+        # today, so this only fires if that cap is ever lifted. The last row
+        # is always kept — it feeds the right-side end labels.
+        if len(df_plot) > 1500:
+            stride = len(df_plot) // 1500
+            _sampled = df_plot.iloc[::stride]
+            if _sampled.index[-1] != df_plot.index[-1]:
+                _sampled = pd.concat([_sampled, df_plot.iloc[[-1]]])
+            df_plot = _sampled
+
         pct_b0 = _find_col(df_plot, [f"Pct_{b0}", f"pct_{b0.lower()}"])
         pct_b1 = _find_col(df_plot, [f"Pct_{b1}", f"pct_{b1.lower()}"])
         if not pct_b0:
@@ -470,10 +520,20 @@ def rotate_and_chart(df_scores: pd.DataFrame, policy: dict) -> None:
         if not pct_b1:
             print(f"⚠️ Benchmark series Pct_{b1} not found; skipping {disp_b1} line.")
 
-        to_num = lambda col: pd.to_numeric(df_plot[col], errors="coerce")
-        port_series = to_num(port_col)
-        alpha_b0 = (port_series - to_num(pct_b0)) if pct_b0 else None
-        alpha_b1 = (port_series - to_num(pct_b1)) if pct_b1 else None
+        # Coerce each plotted column exactly once; everything downstream
+        # (fills, lines, alphas, labels) reuses these Series instead of
+        # re-running to_numeric per call site.
+        for c in (pct_b0, pct_b1):
+            if c:
+                df_plot[c] = pd.to_numeric(df_plot[c], errors="coerce")
+        port_series = df_plot[port_col]   # already numeric from the dropna step
+        b0_s = df_plot[pct_b0] if pct_b0 else None
+        b1_s = df_plot[pct_b1] if pct_b1 else None
+        # Both cumulative alphas from one broadcast subtract — a single scan of
+        # the portfolio column instead of one per benchmark.
+        _alpha_df = df_plot[[c for c in (pct_b0, pct_b1) if c]].rsub(port_series, axis=0)
+        alpha_b0 = _alpha_df[pct_b0] if pct_b0 else None
+        alpha_b1 = _alpha_df[pct_b1] if pct_b1 else None
 
         # ── Drawdown policy thresholds from policy ──────────────────────────────
         dr = policy.get("drawdown_rules", {}) or {}
@@ -486,9 +546,9 @@ def rotate_and_chart(df_scores: pd.DataFrame, policy: dict) -> None:
         drawdown_ser = (levels - rolling_peak) / rolling_peak   # 0 to negative
 
         # ── Stats for inset box ──────────────────────────────────────────────────
-        total_ret  = float(port_series.dropna().iloc[-1])
+        total_ret  = float(port_series.at[port_series.last_valid_index()])
         max_dd     = _compute_max_drawdown(port_series)
-        n_days     = len(port_series.dropna())
+        n_days     = int(port_series.notna().sum())
         cagr       = (1 + total_ret) ** (252 / max(n_days, 1)) - 1 if n_days >= 10 else None
 
         # ── Style ────────────────────────────────────────────────────────────────
@@ -527,12 +587,15 @@ def rotate_and_chart(df_scores: pd.DataFrame, policy: dict) -> None:
             )
 
         def _apply_labels(ax, series):
+            # The plotted Series are pre-coerced and only their last valid
+            # point is drawn, so a last_valid_index lookup replaces the
+            # per-series dropna + fancy date reindex.
             last_vals = []
             for name, xs, ys in series:
-                ys2 = pd.to_numeric(ys, errors="coerce").dropna()
-                if ys2.empty:
+                idx = ys.last_valid_index()
+                if idx is None:
                     continue
-                last_vals.append((name, df_plot.loc[ys2.index, date_c], ys2, float(ys2.iloc[-1])))
+                last_vals.append((name, xs.loc[[idx]], ys.loc[[idx]], float(ys.at[idx])))
             last_vals.sort(key=lambda x: x[3])
             nudges = {name: 0 for name, *_ in last_vals}
             for i in range(1, len(last_vals)):
@@ -580,36 +643,42 @@ def rotate_and_chart(df_scores: pd.DataFrame, policy: dict) -> None:
 
         # ── Panel 1: fill under each line to the true minimum ──────────────────
         _all_vals = pd.concat([port_series] +
-                              ([to_num(pct_b0)] if pct_b0 else []) +
-                              ([to_num(pct_b1)] if pct_b1 else []),
+                              ([b0_s] if pct_b0 else []) +
+                              ([b1_s] if pct_b1 else []),
                               axis=0).dropna()
         _floor = float(_all_vals.min())   # exact lowest point across all series
         if pct_b1:
-            b1_s = to_num(pct_b1)
             ax1.fill_between(dates, b1_s, _floor,
-                             alpha=0.13, color="#2ca02c",
+                             alpha=0.13, color="#2ca02c", rasterized=True,
                              interpolate=True, label="_nolegend_")
         if pct_b0:
-            b0_s = to_num(pct_b0)
             ax1.fill_between(dates, b0_s, _floor,
-                             alpha=0.13, color="orange",
+                             alpha=0.13, color="orange", rasterized=True,
                              interpolate=True, label="_nolegend_")
         ax1.fill_between(dates, port_series, _floor,
-                         alpha=0.18, color="#1f77b4",
+                         alpha=0.18, color="#1f77b4", rasterized=True,
                          interpolate=True, label="_nolegend_")
 
         # ── Panel 1: main lines ──────────────────────────────────────────────────
+        # The benchmark lines share every style kwarg, so both go through one
+        # plot() call (one x-conversion and artist-setup pass); label/color
+        # are the only per-line attributes.
+        bench_lines = []
         if pct_b0:
-            ax1.plot(dates, to_num(pct_b0), label=f"{b0} ({disp_b0})", linewidth=1.8,
-                     color="orange", alpha=0.85, zorder=3)
+            bench_lines.append((b0_s, f"{b0} ({disp_b0})", "orange"))
         if pct_b1:
-            ax1.plot(dates, to_num(pct_b1), label=f"{b1} ({disp_b1})", linewidth=1.8,
-                     color="#2ca02c", alpha=0.85, zorder=3)
+            bench_lines.append((b1_s, f"{b1} ({disp_b1})", "#2ca02c"))
+        if bench_lines:
+            _lns = ax1.plot(dates, np.column_stack([s for s, _, _ in bench_lines]),
+                            linewidth=1.8, alpha=0.85, zorder=3, rasterized=True)
+            for _ln, (_, _lbl, _col) in zip(_lns, bench_lines):
+                _ln.set_label(_lbl)
+                _ln.set_color(_col)
         ax1.plot(dates, port_series, label="Titanium (MWS)", linewidth=1.8,
-                 color="#1f77b4", zorder=4)
+                 color="#1f77b4", zorder=4, rasterized=True)
 
         # ── Panel 1: MWS average line ────────────────────────────────────────────
-        mws_avg = float(port_series.dropna().mean())
+        mws_avg = float(port_series.mean())   # mean skips NaN; no dropna copy
         ax1.axhline(mws_avg, color="#1f77b4", linewidth=1.4, linestyle=(0, (4, 3)),
                     alpha=0.7, zorder=2)
 
@@ -634,34 +703,33 @@ def rotate_and_chart(df_scores: pd.DataFrame, policy: dict) -> None:
 
         # ── Panel 1: right-side end labels ──────────────────────────────────────
         series1 = [("Titanium MWS:", dates, port_series)]
-        if pct_b0: series1.append((f"{disp_b0}:", dates, to_num(pct_b0)))
-        if pct_b1: series1.append((f"{disp_b1}:", dates, to_num(pct_b1)))
+        if pct_b0: series1.append((f"{disp_b0}:", dates, b0_s))
+        if pct_b1: series1.append((f"{disp_b1}:", dates, b1_s))
         _apply_labels(ax1, series1)
         _mark_extremes(ax1, dates.reset_index(drop=True), port_series.reset_index(drop=True), "#1f77b4")
-        if pct_b0: _mark_extremes(ax1, dates.reset_index(drop=True), to_num(pct_b0).reset_index(drop=True), "orange", max_va="bottom", min_va="top")
-        if pct_b1: _mark_extremes(ax1, dates.reset_index(drop=True), to_num(pct_b1).reset_index(drop=True), "#2ca02c", max_va="bottom", min_va="bottom")
+        if pct_b0: _mark_extremes(ax1, dates.reset_index(drop=True), b0_s.reset_index(drop=True), "orange", max_va="bottom", min_va="top")
+        if pct_b1: _mark_extremes(ax1, dates.reset_index(drop=True), b1_s.reset_index(drop=True), "#2ca02c", max_va="bottom", min_va="bottom")
 
         # ── Panel 1: horizontal reference lines at last-day value ────────────────
         line_styles = [
-            (port_series,                              "#1f77b4", 0.8),
-            (to_num(pct_b0) if pct_b0 else None,      "orange",  0.8),
-            (to_num(pct_b1) if pct_b1 else None,      "#2ca02c", 0.8),
+            (port_series, "#1f77b4", 0.8),
+            (b0_s,        "orange",  0.8),
+            (b1_s,        "#2ca02c", 0.8),
         ]
         x_start = dates.iloc[0]
         for ys, color, lw in line_styles:
             if ys is None:
                 continue
-            ys2 = pd.to_numeric(ys, errors="coerce").dropna()
-            if ys2.empty:
+            last_idx = ys.last_valid_index()   # already numeric; no dropna copy
+            if last_idx is None:
                 continue
-            y_end = float(ys2.iloc[-1])
+            y_end = float(ys.at[last_idx])
             ax1.axhline(y_end, color=color, linewidth=lw * 2, linestyle="--",
                         alpha=0.5, zorder=1)
 
         # ── Panel 1: MWS average line — dash-dot, lighter blue, distinct from dashed last-value lines
-        port_clean = pd.to_numeric(port_series, errors="coerce").dropna()
-        if not port_clean.empty:
-            port_avg = float(port_clean.mean())
+        if port_series.notna().any():
+            port_avg = float(port_series.mean())
             ax1.axhline(port_avg, color="#333333", linewidth=1.4, linestyle="-",
                         alpha=0.5, zorder=2)
             ax1.scatter(dates.iloc[-1], port_avg, s=80, zorder=6,
@@ -672,24 +740,33 @@ def rotate_and_chart(df_scores: pd.DataFrame, policy: dict) -> None:
         # ── Panel 2: cumulative alpha with fill-between ──────────────────────────
         ax2.axhline(0, color="#888", linewidth=1.0, zorder=1)
 
+        # Same single-call coalescing as panel 1: both alpha lines share their
+        # style kwargs; the sign-split fills keep their per-benchmark colors.
+        alpha_lines = []
+        if alpha_b0 is not None:
+            alpha_lines.append((alpha_b0, f"vs {disp_b0}", "orange"))
+        if alpha_b1 is not None:
+            alpha_lines.append((alpha_b1, f"vs {disp_b1}", "#2ca02c"))
+        if alpha_lines:
+            _lns2 = ax2.plot(dates, np.column_stack([s for s, _, _ in alpha_lines]),
+                             linewidth=2.0, zorder=3, rasterized=True)
+            for _ln, (_, _lbl, _col) in zip(_lns2, alpha_lines):
+                _ln.set_label(_lbl)
+                _ln.set_color(_col)
         if alpha_b0 is not None:
-            ax2.plot(dates, alpha_b0, linewidth=2.0, color="orange",
-                     label=f"vs {disp_b0}", zorder=3)
             ax2.fill_between(dates, alpha_b0, 0,
                              where=(alpha_b0 >= 0), alpha=0.18, color="orange",
-                             interpolate=True, label="_nolegend_")
+                             rasterized=True, interpolate=True, label="_nolegend_")
             ax2.fill_between(dates, alpha_b0, 0,
                              where=(alpha_b0 < 0),  alpha=0.18, color="red",
-                             interpolate=True, label="_nolegend_")
+                             rasterized=True, interpolate=True, label="_nolegend_")
         if alpha_b1 is not None:
-            ax2.plot(dates, alpha_b1, linewidth=2.0, color="#2ca02c",
-                     label=f"vs {disp_b1}", zorder=3)
             ax2.fill_between(dates, alpha_b1, 0,
                              where=(alpha_b1 >= 0), alpha=0.18, color="#2ca02c",
-                             interpolate=True, label="_nolegend_")
+                             rasterized=True, interpolate=True, label="_nolegend_")
             ax2.fill_between(dates, alpha_b1, 0,
                              where=(alpha_b1 < 0),  alpha=0.18, color="red",
-                             interpolate=True, label="_nolegend_")
+                             rasterized=True, interpolate=True, label="_nolegend_")
 
         ax2.set_title(f"Cumulative Alpha vs. Benchmarks (since {chart_start.strftime('%b %d, %Y') if pd.notna(chart_start) else chart_start_str})",
                       fontsize=11, fontweight="bold", pad=8)
@@ -764,10 +841,24 @@ def rotate_and_chart(df_scores: pd.DataFrame, policy: dict) -> None:
         plt.tight_layout(rect=[0, 0, 0.90, 1])   # leave right margin for labels
         plt.subplots_adjust(bottom=0.28, hspace=0.2)  # extra room for event labels
         plt.savefig(CHART_FILENAME, dpi=150, bbox_inches="tight")
+        # Record the rendered inputs — recomputed, since the label backfill
+        # may have bumped the log's mtime after the entry check.
+        try:
+            with open(sig_path, "w") as f:
+                f.write(_chart_signature(policy))
+        except OSError:
+            pass
         print(f"\n✅ Chart generated: {CHART_FILENAME}")
-        # Auto-open the chart only on macOS; skip silently on Linux/Windows
-        if platform.system() == "Darwin":
-            subprocess.run(["open", CHART_FILENAME], check=False)
+        # Auto-open the chart only on macOS (and only for an interactive
+        # session — headless/CI runs skip the viewer). Popen without wait:
+        # the `open` helper's fork/exec happens off the critical path.
+        if platform.system() == "Darwin" and sys.stdout.isatty():
+            subprocess.Popen(
+                ["open", CHART_FILENAME],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                start_new_session=True,
+            )
 
     except Exception as e:
         print(f"⚠️ Charting Error: {e}")
@@ -114,7 +114,7 @@ def run_analytics() -> dict:
     except Exception as _dds_err:
         log.warning("update_and_check_drawdown_state failed (non-fatal): %s", _dds_err)
 
-    mws_analytics.generate_policy_runtime(policy)   # regenerate stripped policy for LLM
+    policy_runtime = mws_analytics.generate_policy_runtime(policy)   # regenerate stripped policy for LLM
 
     # Per-ticker execution gate — compute for BOTH BUY and SELL directions.
     # Fix: previously hardcoded trade_direction="BUY" for all tickers, making:
@@ -151,6 +151,7 @@ def run_analytics() -> dict:
 
     return {
         "policy":          policy,
+        "policy_runtime":  policy_runtime,
         "holdings":        hold,
         "hist":            hist,       # kept for portfolio table MV calculations
         "drawdown":        dd,
@@ -173,15 +174,18 @@ def build_prompt(analytics: dict) -> str:
     gates   = analytics["df_gates"]
 
     # Use the auto-generated runtime policy (stripped of notes/rationale, ~65% smaller).
-    # POLICY_RUNTIME_FILE is written by generate_policy_runtime() during run_analytics()
-    # so it is always fresh.  Fall back to full policy minus ticker_constraints if missing.
-    try:
-        with open(POLICY_RUNTIME_FILE, encoding="utf-8") as _rf:
-            policy_trimmed = json.load(_rf)
-    except Exception:
-        policy_trimmed = {k: v for k, v in policy.items() if k not in [
-            "ticker_constraints", "objectives", "news_intelligence", "definitions",
-        ]}
+    # generate_policy_runtime() returns the stripped dict during run_analytics(), so
+    # prefer that in-memory copy and skip re-reading POLICY_RUNTIME_FILE from disk.
+    # Fall back to the file, then to full policy minus ticker_constraints, if absent.
+    policy_trimmed = analytics.get("policy_runtime")
+    if not policy_trimmed:
+        try:
+            with open(POLICY_RUNTIME_FILE, encoding="utf-8") as _rf:
+                policy_trimmed = json.load(_rf)
+        except Exception:
+            policy_trimmed = {k: v for k, v in policy.items() if k not in [
+                "ticker_constraints", "objectives", "news_intelligence", "definitions",
+            ]}
 
     scores_str = scores.to_string(index=False) if not scores.empty else "No rankings generated."
     gates_str  = gates.to_string(index=False)  if not gates.empty  else "Execution gate disabled or no data."
@@ -632,26 +636,33 @@ def _build_portfolio_tables(analytics: dict) -> str:
 
         # ── Per-ticker price / MV ─────────────────────────────────────────────
         fixed_raw = (policy.get("governance", {}) or {}).get("fixed_asset_prices", {}) or {}
-        latest_px = hist.iloc[-1]
-
-        def _get_price(ticker: str) -> float:
-            entry = fixed_raw.get(ticker)
-            if entry is not None:
-                if isinstance(entry, dict):
-                    lp = latest_px.get(ticker)
-                    if lp is not None and float(lp) > 0:
-                        return float(lp)
-                    return float(entry.get("fallback_price", 0))
-                try:
-                    return float(entry)
-                except (TypeError, ValueError):
-                    return 0.0
-            lp = latest_px.get(ticker)
-            return float(lp) if lp is not None else 0.0
-
-        hold["Price"] = hold["Ticker"].map(_get_price)
+        latest_px = mws_analytics._latest_prices(hist)
+
+        def _resolve_fixed(ticker: str, entry) -> float:
+            if isinstance(entry, dict):
+                lp = latest_px.get(ticker)
+                if lp is not None and float(lp) > 0:
+                    return float(lp)
+                return float(entry.get("fallback_price", 0))
+            try:
+                return float(entry)
+            except (TypeError, ValueError):
+                return 0.0
+
+        # Vectorized pricing: the (small) fixed-price table is resolved once per
+        # asset, then holdings are priced with two C-level maps instead of a
+        # per-row Python callback doing isinstance/float dispatch.
+        fixed_px = pd.Series(
+            {t: _resolve_fixed(t, e) for t, e in fixed_raw.items()}, dtype=float
+        )
+        hold["Price"] = (
+            hold["Ticker"].map(fixed_px)
+            .combine_first(hold["Ticker"].map(latest_px))
+            .fillna(0.0)
+        )
         hold["MV"]    = hold["Shares"] * hold["Price"]
-        held_tickers  = set(hold["Ticker"].tolist())
+        # frozenset: membership-tested per ticker throughout the table builders
+        held_tickers  = frozenset(hold["Ticker"].tolist())
 
         # ── Allocatable denominator ───────────────────────────────────────────
         overlay_mv  = hold.loc[hold["Class"] == "managed_futures", "MV"].sum()
@@ -0,0 +1,233 @@
+"""
+tests/cache/test_perf_log_caches.py
+
+Tests for the stateful perf-log / charting caches:
+
+  1. _load_perf_log() — the (path, mtime_ns, size)-keyed parse cache.
+     Same on-disk version must return the same cached frame; a rewrite
+     (new mtime/size) must invalidate the entry and re-parse.
+  2. The Parquet mirror preference inside _load_perf_log(): the mirror is
+     used only when it is at least as new as the CSV; a CSV-only rewrite
+     (e.g. the event-label backfill) must fall back to the text path.
+  3. rotate_and_chart()'s signature skip: identical inputs leave the PNG
+     untouched; a perf-log rewrite or a reporting_baselines change forces
+     a re-render.
+"""
+import os
+import sys
+
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+import matplotlib; matplotlib.use("Agg")
+import mws_analytics as mws
+import mws_charts
+
+
+# ── Helpers ───────────────────────────────────────────────────────────────────
+
+def _write_perf_csv(path, n=12, label=""):
+    """Write a minimal perf-log CSV with the columns the loader projects to."""
+    dates = pd.bdate_range("2026-01-02", periods=n).strftime("%Y-%m-%d")
+    df = pd.DataFrame({
+        "Date":         dates,
+        "PortfolioPct": [round(0.001 * i, 6) for i in range(n)],
+        "Pct_VTI":      [round(0.0008 * i, 6) for i in range(n)],
+        "Pct_QQQ":      [round(0.0012 * i, 6) for i in range(n)],
+        "EventLabel":   [label] * n,
+    })
+    df.to_csv(path, index=False)
+    return df
+
+
+def _bump_mtime(path, seconds=2):
+    """Push a file's mtime forward so stat-keyed checks see a new version."""
+    st = os.stat(path)
+    new_ns = st.st_mtime_ns + seconds * 1_000_000_000
+    os.utime(path, ns=(new_ns, new_ns))
+
+
+def _chart_policy(chart_start="2026-01-02", benchmarks=("VTI", "QQQ")):
+    return {
+        "governance": {
+            "reporting_baselines": {
+                "active_benchmarks": list(benchmarks),
+                "chart_start_date": chart_start,
+            },
+        },
+        "drawdown_rules": {"soft_limit": 0.20, "hard_limit": 0.28},
+    }
+
+
+# ── Tests: _load_perf_log version-keyed cache ─────────────────────────────────
+
+class TestPerfLogCache:
+    """
+    _load_perf_log() keys its parse cache on (path, mtime_ns, size): the same
+    on-disk version must be parsed once and shared, while any rewrite — the
+    updater or the label backfill — must invalidate the entry.
+    """
+
+    def test_same_version_returns_cached_frame(self, tmp_path):
+        """Two loads of an unchanged file share one parsed frame (cache hit)."""
+        mws._read_perf_log_cached.cache_clear()
+        path = str(tmp_path / "perf.csv")
+        _write_perf_csv(path)
+
+        df1 = mws._load_perf_log(path)
+        df2 = mws._load_perf_log(path)
+        assert df1 is df2, (
+            "Unchanged (path, mtime_ns, size) must be a cache hit — callers "
+            "share one cleaned frame per on-disk version."
+        )
+
+    def test_rewrite_invalidates_cache(self, tmp_path):
+        """A rewrite with a new mtime must re-parse and surface the new rows."""
+        mws._read_perf_log_cached.cache_clear()
+        path = str(tmp_path / "perf.csv")
+        _write_perf_csv(path, n=10)
+        df1 = mws._load_perf_log(path)
+        assert len(df1) == 10
+
+        _write_perf_csv(path, n=11)
+        _bump_mtime(path)
+        df2 = mws._load_perf_log(path)
+        assert df2 is not df1, "New file version must not reuse the stale entry"
+        assert len(df2) == 11, (
+            "After a rewrite bumps mtime, _load_perf_log must re-parse and "
+            "return the appended row."
+        )
+
+    def test_missing_file_returns_none(self, tmp_path):
+        """Missing log → None, matching the pre-cache behavior."""
+        assert mws._load_perf_log(str(tmp_path / "absent.csv")) is None
+
+
+# ── Tests: Parquet mirror vs CSV preference ───────────────────────────────────
+
+class TestParquetMirrorPreference:
+    """
+    When a parquet engine is installed, _load_perf_log() reads the mirror only
+    while it is at least as new as the CSV. A CSV-only rewrite (the label
+    backfill) leaves the CSV newer, so the text path must win until the next
+    mirror write — otherwise freshly-written labels would never be plotted.
+    """
+
+    @pytest.mark.skipif(not mws._CSV_ENGINE_KW, reason="pyarrow not installed")
+    def test_mirror_used_when_at_least_as_new(self, tmp_path):
+        """Mirror mtime >= CSV mtime → the columnar copy is read."""
+        mws._read_perf_log_cached.cache_clear()
+        path = str(tmp_path / "perf.csv")
+        _write_perf_csv(path)
+
+        mirror = pd.read_csv(path)
+        mirror["PortfolioPct"] = 9.99   # marker: only present in the mirror
+        pq = mws._perf_log_parquet_path(path)
+        mirror.to_parquet(pq, index=False)
+        _bump_mtime(pq)
+
+        df = mws._load_perf_log(path)
+        assert float(df["PortfolioPct"].iloc[0]) == 9.99, (
+            "With the mirror at least as new as the CSV, the parquet copy "
+            "must be the one returned."
+        )
+
+    @pytest.mark.skipif(not mws._CSV_ENGINE_KW, reason="pyarrow not installed")
+    def test_csv_newer_than_mirror_wins(self, tmp_path):
+        """A CSV-only rewrite must fall back to the text path (fresh labels)."""
+        mws._read_perf_log_cached.cache_clear()
+        path = str(tmp_path / "perf.csv")
+        _write_perf_csv(path)
+
+        pd.read_csv(path).to_parquet(mws._perf_log_parquet_path(path), index=False)
+        # Simulate the label backfill: rewrite the CSV only, leaving the
+        # mirror behind it.
+        _write_perf_csv(path, label="CPI print")
+        _bump_mtime(path)
+
+        df = mws._load_perf_log(path)
+        assert (df["EventLabel"] == "CPI print").all(), (
+            "CSV newer than the mirror must read the CSV — a stale mirror "
+            "must never shadow a label-backfilled log."
+        )
+
+    @pytest.mark.skipif(not mws._CSV_ENGINE_KW, reason="pyarrow not installed")
+    def test_mirror_missing_falls_back_to_csv(self, tmp_path):
+        """No mirror on disk → plain CSV read, no error."""
+        mws._read_perf_log_cached.cache_clear()
+        path = str(tmp_path / "perf.csv")
+        expected = _write_perf_csv(path)
+        df = mws._load_perf_log(path)
+        assert len(df) == len(expected)
+
+
+# ── Tests: chart signature skip ───────────────────────────────────────────────
+
+class TestChartSignatureSkip:
+    """
+    rotate_and_chart() fingerprints the perf-log mtime and the
+    reporting_baselines block; a matching stored signature skips the render.
+    The skip must fire only when neither input changed.
+    """
+
+    def _setup(self, tmp_path, monkeypatch):
+        perf = str(tmp_path / "perf.csv")
+        png = str(tmp_path / "chart.png")
+        _write_perf_csv(perf)
+        monkeypatch.setattr(mws_charts, "PERF_LOG_CSV", perf)
+        monkeypatch.setattr(mws_charts, "CHART_FILENAME", png)
+        monkeypatch.setattr(mws, "PERF_LOG_CSV", perf)
+        # The label backfill must no-op (no API key) rather than hit the network.
+        monkeypatch.delenv("ANTHROPIC_API_KEY", raising=False)
+        mws._read_perf_log_cached.cache_clear()
+        return perf, png
+
+    def _age_png(self, png):
+        """Reset the PNG mtime so a re-render (or its absence) is observable."""
+        old_ns = 1_000_000_000_000_000_000  # 2001-09-09, safely in the past
+        os.utime(png, ns=(old_ns, old_ns))
+        return old_ns
+
+    def test_identical_inputs_skip_rerender(self, tmp_path, monkeypatch):
+        """Second call with the same log and baselines must not rewrite the PNG."""
+        perf, png = self._setup(tmp_path, monkeypatch)
+        policy = _chart_policy()
+
+        mws_charts.rotate_and_chart(pd.DataFrame(), policy)
+        assert os.path.exists(png), "First call must render the chart"
+        assert os.path.exists(png + ".sig"), "First call must record its signature"
+
+        old_ns = self._age_png(png)
+        mws_charts.rotate_and_chart(pd.DataFrame(), policy)
+        assert os.stat(png).st_mtime_ns == old_ns, (
+            "Unchanged perf log + baselines must skip the re-render and leave "
+            "the PNG untouched."
+        )
+
+    def test_log_rewrite_forces_rerender(self, tmp_path, monkeypatch):
+        """A perf-log rewrite changes the signature → the chart is redrawn."""
+        perf, png = self._setup(tmp_path, monkeypatch)
+        policy = _chart_policy()
+        mws_charts.rotate_and_chart(pd.DataFrame(), policy)
+        old_ns = self._age_png(png)
+
+        _write_perf_csv(perf, n=13)
+        _bump_mtime(perf)
+        mws_charts.rotate_and_chart(pd.DataFrame(), policy)
+        assert os.stat(png).st_mtime_ns != old_ns, (
+            "A newer perf log must invalidate the signature and re-render."
+        )
+
+    def test_baseline_change_forces_rerender(self, tmp_path, monkeypatch):
+        """Editing reporting_baselines changes the signature → redraw."""
+        perf, png = self._setup(tmp_path, monkeypatch)
+        mws_charts.rotate_and_chart(pd.DataFrame(), _chart_policy())
+        old_ns = self._age_png(png)
+
+        # Same log, different chart window — as after a policy edit.
+        mws_charts.rotate_and_chart(pd.DataFrame(), _chart_policy(chart_start="2026-01-06"))
+        assert os.stat(png).st_mtime_ns != old_ns, (
+            "A reporting_baselines change must invalidate the signature and "
+            "re-render even though the perf log is unchanged."
+        )